@@ -0,0 +1,40 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+# Compiled piecewise-linear curve lookups used by the sweep path in main.py.
+# Build in place with: python setup.py build_ext --inplace
+import numpy as np
+
+
+cdef inline double interp_scalar(const double* xs, const double* ys, Py_ssize_t n, double target) noexcept nogil:
+    # Same semantics as main.eval_curve: clamp at the ends, bisect-left for the segment.
+    cdef Py_ssize_t lo = 0
+    cdef Py_ssize_t hi = n - 1
+    cdef Py_ssize_t mid
+    if target <= xs[0]:
+        return ys[0]
+    if target >= xs[n - 1]:
+        return ys[n - 1]
+    while hi - lo > 1:
+        mid = (lo + hi) >> 1
+        if xs[mid] < target:
+            lo = mid
+        else:
+            hi = mid
+    if xs[hi] == xs[lo]:
+        return ys[hi]
+    return ys[lo] + (target - xs[lo]) / (xs[hi] - xs[lo]) * (ys[hi] - ys[lo])
+
+
+def interp_batch(const double[::1] xs, const double[::1] ys, const double[::1] targets):
+    cdef Py_ssize_t n = xs.shape[0]
+    cdef Py_ssize_t count = targets.shape[0]
+    cdef Py_ssize_t i
+    if n == 0:
+        raise ValueError("Curve has no points.")
+    if ys.shape[0] != n:
+        raise ValueError("Curve x and y arrays differ in length.")
+    out = np.empty(count, dtype=np.float64)
+    cdef double[::1] out_view = out
+    with nogil:
+        for i in range(count):
+            out_view[i] = interp_scalar(&xs[0], &ys[0], n, targets[i])
+    return out
@@ -0,0 +1,98 @@
+# Numba kernels for main.simulate_sweep. Kept in their own module so main.py does not import Numba
+# until the first sweep, and at module level so cache=True can reuse the compiled code across runs.
+import sys
+from typing import Any
+
+import numpy as np
+from numba import njit
+
+# cache=True needs the source file on disk, which a frozen (PyInstaller) build does not have.
+_jit = njit(cache=not getattr(sys, "frozen", False), fastmath=True)
+
+
+@_jit
+def interp_kernel(xs: Any, ys: Any, target: float) -> float:
+    # Same semantics as eval_curve: clamp at the ends, bisect-left for the segment.
+    n = xs.shape[0]
+    if target <= xs[0]:
+        return ys[0]
+    if target >= xs[n - 1]:
+        return ys[n - 1]
+    lo = 0
+    hi = n - 1
+    while hi - lo > 1:
+        mid = (lo + hi) >> 1
+        if xs[mid] < target:
+            lo = mid
+        else:
+            hi = mid
+    x0 = xs[lo]
+    x1 = xs[hi]
+    if x1 == x0:
+        return ys[hi]
+    return ys[lo] + (target - x0) / (x1 - x0) * (ys[hi] - ys[lo])
+
+
+@_jit
+def sweep_kernel(
+    currents: Any,
+    iv_xs: Any,
+    iv_ys: Any,
+    power_xs: Any,
+    power_ys: Any,
+    vout_xs: Any,
+    vout_ys: Any,
+    load_xs: Any,
+    load_ys: Any,
+    series: float,
+    parallel: float,
+    inv_max_power: float,
+    blend_w: float,
+    blend_denom: float,
+) -> tuple:
+    # Fused forward voltage + efficiency blend for every current; empty curve arrays mean "no data".
+    n = currents.shape[0]
+    module_v = np.empty(n)
+    power = np.empty(n)
+    eff = np.empty(n)
+    for i in range(n):
+        volts = interp_kernel(iv_xs, iv_ys, currents[i] / parallel) * series
+        watts = volts * currents[i]
+        module_v[i] = volts
+        power[i] = watts
+        if volts <= 0:
+            eff[i] = 0.0
+            continue
+        primary = 0.0
+        have_primary = False
+        others_sum = 0.0
+        others_n = 0
+        for k in range(3):
+            if k == 0:
+                if power_xs.shape[0] == 0:
+                    continue
+                value = interp_kernel(power_xs, power_ys, watts)
+            elif k == 1:
+                if vout_xs.shape[0] == 0:
+                    continue
+                value = interp_kernel(vout_xs, vout_ys, volts)
+            else:
+                if load_xs.shape[0] == 0:
+                    continue
+                load_pct = min(max(watts * inv_max_power * 100.0, 0.0), 150.0)
+                value = interp_kernel(load_xs, load_ys, load_pct)
+            if not have_primary:
+                primary = value
+                have_primary = True
+            else:
+                others_sum += value
+                others_n += 1
+        if not have_primary:
+            eff[i] = 0.85
+            continue
+        if others_n == 0 or blend_w <= 0:
+            blended = (primary + others_sum) / (others_n + 1)
+        else:
+            blended = (primary * blend_w + others_sum / others_n) / blend_denom
+        eff[i] = min(max(blended, 0.5), 0.98)
+    return module_v, power, eff
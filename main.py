@@ -1,10 +1,39 @@
 import argparse
+import bisect
+import functools
+import hashlib
 import json
 import os
 import sys
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+NUMPY_AVAILABLE = False
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Optional compiled batch interpolation (see _curve.pyx); a NumPy lookup is used when it is not built.
+CURVE_EXT_AVAILABLE = False
+try:
+    from _curve import interp_batch as _interp_batch_ext
+
+    CURVE_EXT_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    CURVE_EXT_AVAILABLE = False
+
+# orjson parses bytes directly and is considerably faster; the stdlib parser is the fallback.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 QT_AVAILABLE = False
 try:
@@ -33,54 +62,180 @@ try:
 except ImportError:
     QT_AVAILABLE = False
 
-Curve = List[Tuple[float, float]]
-
 # Lux Dynamics branding, with a light background
 COLOR_BG = "#ffffff"
 COLOR_TEXT = "#0b0b0b"
 COLOR_ACCENT = "#7dc242"  # green arrow hue
 COLOR_MUTED = "#4b5563"   # soft gray for secondary text
 
+# Window stylesheet, formatted once at import instead of per window.
+_THEME_QSS = f"""
+    QMainWindow {{
+        background-color: {COLOR_BG};
+        color: {COLOR_TEXT};
+        font-family: "Century Gothic", "Arial", sans-serif;
+    }}
+    QWidget {{
+        background-color: {COLOR_BG};
+        color: {COLOR_TEXT};
+        font-family: "Century Gothic", "Arial", sans-serif;
+    }}
+    QLabel {{
+        color: {COLOR_TEXT};
+        font-size: 12pt;
+        font-family: "Century Gothic", "Arial", sans-serif;
+    }}
+    QLineEdit, QTextEdit {{
+        background-color: #f5f5f5;
+        color: {COLOR_TEXT};
+        border: 1px solid #d1d5db;
+        padding: 4px;
+        font-family: "Century Gothic", "Arial", sans-serif;
+    }}
+    QDoubleSpinBox {{
+        background-color: #f5f5f5;
+        color: {COLOR_TEXT};
+        border: 1px solid #d1d5db;
+        padding: 2px 4px;
+        min-height: 28px;
+        font-family: "Century Gothic", "Arial", sans-serif;
+    }}
+    QDoubleSpinBox::up-button, QDoubleSpinBox::down-button {{
+        background: #e5e7eb;
+        width: 18px;
+        border: 1px solid #d1d5db;
+    }}
+    QDoubleSpinBox::up-arrow, QDoubleSpinBox::down-arrow {{
+        width: 10px;
+        height: 10px;
+    }}
+    QCheckBox {{
+        color: {COLOR_TEXT};
+    }}
+    QPushButton {{
+        background-color: {COLOR_ACCENT};
+        color: #0b0b0b;
+        border: 1px solid {COLOR_ACCENT};
+        padding: 6px 12px;
+        font-weight: bold;
+        border-radius: 4px;
+    }}
+    QPushButton:hover {{
+        background-color: #8ed452;
+        border-color: #8ed452;
+    }}
+    QPlainTextEdit, QTextEdit {{
+        background-color: #f9fafb;
+        color: {COLOR_TEXT};
+        border: 1px solid #d1d5db;
+    }}
+    QToolTip {{
+        background-color: #e5e7eb;
+        color: {COLOR_TEXT};
+        border: 1px solid {COLOR_ACCENT};
+    }}
+"""
+
+# Upper bound on memoized operating points kept per Driver/Module.
+MEMO_MAXSIZE = 1024
+
+
+def _derived(default: Any = None) -> Any:
+    # Dataclass field computed in __post_init__ rather than passed in.
+    return field(default=default, init=False, repr=False, compare=False)
+
+
+def _first(d: dict, *keys: str, default: Any = None) -> Any:
+    # First value among the alias keys that is present and not None (0 counts as present).
+    for key in keys:
+        value = d.get(key)
+        if value is not None:
+            return value
+    return default
+
+
+def _optional_float(value: Any) -> Optional[float]:
+    return float(value) if value is not None else None
+
 
 def clamp(value: float, low: float, high: float) -> float:
     return max(low, min(high, value))
 
 
+@dataclass(frozen=True, slots=True)
+class Curve:
+    # Parallel x/y tuples sorted by x, so lookups can bisect xs directly.
+    xs: Tuple[float, ...] = ()
+    ys: Tuple[float, ...] = ()
+    # float64 copies for the batch lookups; None when NumPy is unavailable.
+    xs_arr: Any = _derived()
+    ys_arr: Any = _derived()
+
+    def __post_init__(self) -> None:
+        if NUMPY_AVAILABLE:
+            object.__setattr__(self, "xs_arr", np.asarray(self.xs, dtype=np.float64))
+            object.__setattr__(self, "ys_arr", np.asarray(self.ys, dtype=np.float64))
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+
 def build_curve(data: Optional[dict], x_key: str, y_key: str) -> Curve:
     if not isinstance(data, dict):
-        return []
+        return Curve()
     xs = data.get(x_key) or []
     ys = data.get(y_key) or []
-    pairs: Curve = []
+    pairs = []
     for x, y in zip(xs, ys):
         try:
             pairs.append((float(x), float(y)))
         except (TypeError, ValueError):
             continue
     pairs.sort(key=lambda p: p[0])
-    return pairs
+    return Curve(tuple(x for x, _ in pairs), tuple(y for _, y in pairs))
 
 
 def eval_curve(points: Curve, target: float) -> Optional[float]:
-    if not points:
+    xs, ys = points.xs, points.ys
+    if not xs:
         return None
-    xs, ys = zip(*points)
     if target <= xs[0]:
         return ys[0]
     if target >= xs[-1]:
         return ys[-1]
-    for idx in range(1, len(xs)):
-        if target <= xs[idx]:
-            x0, y0 = xs[idx - 1], ys[idx - 1]
-            x1, y1 = xs[idx], ys[idx]
-            if x1 == x0:
-                return y1
-            ratio = (target - x0) / (x1 - x0)
-            return y0 + ratio * (y1 - y0)
-    return ys[-1]
-
-
-@dataclass
+    idx = bisect.bisect_left(xs, target)
+    x0, y0 = xs[idx - 1], ys[idx - 1]
+    x1, y1 = xs[idx], ys[idx]
+    if x1 == x0:
+        return y1
+    ratio = (target - x0) / (x1 - x0)
+    return y0 + ratio * (y1 - y0)
+
+
+def eval_curve_array(points: Curve, targets: Any) -> Optional[Any]:
+    # Vectorized eval_curve: same end clamping and bisect-left segment choice, so duplicate x values
+    # resolve like the scalar path (np.interp would pick the last duplicate instead).
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("NumPy is not installed. Install it to evaluate curves in batch (pip install numpy).")
+    if not points:
+        return None
+    if CURVE_EXT_AVAILABLE:
+        values = np.asarray(targets, dtype=np.float64)
+        return _interp_batch_ext(points.xs_arr, points.ys_arr, values.ravel()).reshape(values.shape)
+    xs, ys = points.xs_arr, points.ys_arr
+    values = np.asarray(targets, dtype=np.float64)
+    if len(xs) == 1:
+        return np.full(values.shape, ys[0])
+    hi = np.clip(np.searchsorted(xs, values, side="left"), 1, len(xs) - 1)
+    x0, y0, x1, y1 = xs[hi - 1], ys[hi - 1], xs[hi], ys[hi]
+    span = x1 - x0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = np.where(span == 0, y1, y0 + (values - x0) / span * (y1 - y0))
+    result = np.where(values >= xs[-1], ys[-1], result)
+    return np.where(values <= xs[0], ys[0], result)
+
+
+@dataclass(frozen=True, slots=True)
 class Driver:
     label: str
     min_input_v: float
@@ -90,10 +245,65 @@ class Driver:
     max_power: float
     efficiency_blend_weight: float
     curves: Dict[str, Curve]
+    # Memoized efficiencies keyed on the exact (output_v, output_power, input_v); None when there is no usable curve data.
+    _efficiency_cache: Optional[Dict[tuple, float]] = _derived()
+    # Curve references, presence flags, and constants hoisted out of estimate_efficiency.
+    _power_curve: Curve = _derived()
+    _load_curve: Curve = _derived()
+    _vout_120_curve: Curve = _derived()
+    _vout_277_curve: Curve = _derived()
+    _has_power_curve: bool = _derived(False)
+    _has_load_curve: bool = _derived(False)
+    _has_vout_120: bool = _derived(False)
+    _has_vout_277: bool = _derived(False)
+    _has_any_curve: bool = _derived(False)
+    _inv_max_power: float = _derived(0.0)
+    _blend_denom: float = _derived(1.0)
+    # A zero limit in the profile means "not specified".
+    _has_min_input_limit: bool = _derived(False)
+    _has_max_input_limit: bool = _derived(False)
+    _has_min_v_limit: bool = _derived(False)
+    _has_max_v_limit: bool = _derived(False)
+    _has_max_power_limit: bool = _derived(False)
+
+    def __post_init__(self) -> None:
+        # Frozen dataclass: derived fields are written once here via object.__setattr__.
+        set_attr = object.__setattr__
+        power_curve = self.curves["efficiency_vs_output_power"]
+        load_curve = self.curves["efficiency_vs_load"]
+        vout_120_curve = self.curves["efficiency_vs_vout_120"]
+        vout_277_curve = self.curves["efficiency_vs_vout_277"]
+        set_attr(self, "_power_curve", power_curve)
+        set_attr(self, "_load_curve", load_curve)
+        set_attr(self, "_vout_120_curve", vout_120_curve)
+        set_attr(self, "_vout_277_curve", vout_277_curve)
+        has_power_curve = bool(power_curve)
+        # The load curve is only usable when load percent can be computed.
+        has_load_curve = bool(load_curve) and self.max_power > 0
+        has_vout_120 = bool(vout_120_curve)
+        has_vout_277 = bool(vout_277_curve)
+        has_any_curve = has_power_curve or has_load_curve or has_vout_120 or has_vout_277
+        set_attr(self, "_has_power_curve", has_power_curve)
+        set_attr(self, "_has_load_curve", has_load_curve)
+        set_attr(self, "_has_vout_120", has_vout_120)
+        set_attr(self, "_has_vout_277", has_vout_277)
+        set_attr(self, "_has_any_curve", has_any_curve)
+        if has_any_curve:
+            set_attr(self, "_efficiency_cache", {})
+        set_attr(self, "_inv_max_power", 1.0 / self.max_power if self.max_power > 0 else 0.0)
+        set_attr(self, "_blend_denom", self.efficiency_blend_weight + 1.0)
+        set_attr(self, "_has_min_input_limit", bool(self.min_input_v))
+        set_attr(self, "_has_max_input_limit", bool(self.max_input_v))
+        set_attr(self, "_has_min_v_limit", bool(self.min_v))
+        set_attr(self, "_has_max_v_limit", bool(self.max_v))
+        set_attr(self, "_has_max_power_limit", bool(self.max_power))
 
     @classmethod
     def from_file(cls, path: Path) -> "Driver":
-        data = json.loads(path.read_text())
+        return cls.from_json(_json_loads(path.read_bytes()), path.stem)
+
+    @classmethod
+    def from_json(cls, data: dict, fallback_label: str) -> "Driver":
         info = data.get("info", {})
         curves_raw = data.get("curves", {})
         curves = {
@@ -103,60 +313,127 @@ class Driver:
             "efficiency_vs_vout_277": build_curve(curves_raw.get("efficiency_vs_vout_277"), "vout_v", "efficiency"),
         }
         return cls(
-            label=str(info.get("model") or info.get("brand") or info.get("name") or path.stem),
-            min_input_v=float(info.get("min_input_volts") or info.get("vin_min") or 0.0),
-            max_input_v=float(info.get("max_input_volts") or info.get("vin_max") or 0.0),
-            min_v=float(info.get("min_voltage") or info.get("vout_min") or 0.0),
-            max_v=float(info.get("max_voltage") or info.get("vout_max") or 0.0),
-            max_power=float(info.get("max_power") or info.get("pout_max") or 0.0),
-            efficiency_blend_weight=float(info.get("efficiency_blend_weight") or 1.0),
+            # Labels keep truthiness: an empty "model" falls through to the next key.
+            label=str(next((v for k in ("model", "brand", "name") if (v := info.get(k))), fallback_label)),
+            min_input_v=float(_first(info, "min_input_volts", "vin_min", default=0.0)),
+            max_input_v=float(_first(info, "max_input_volts", "vin_max", default=0.0)),
+            min_v=float(_first(info, "min_voltage", "vout_min", default=0.0)),
+            max_v=float(_first(info, "max_voltage", "vout_max", default=0.0)),
+            max_power=float(_first(info, "max_power", "pout_max", default=0.0)),
+            efficiency_blend_weight=float(_first(info, "efficiency_blend_weight", default=1.0)),
             curves=curves,
         )
 
     def estimate_efficiency(self, output_v: float, output_power: float, input_v: float) -> float:
+        # Without usable curve data every estimate is the flat default; skip the memo lookup too.
+        if not self._has_any_curve:
+            return 0.85
+        cache = self._efficiency_cache
+        key = (output_v, output_power, input_v)
+        efficiency = cache.get(key)
+        if efficiency is None:
+            efficiency = self._compute_efficiency(output_v, output_power, input_v)
+            if len(cache) >= MEMO_MAXSIZE:
+                cache.clear()
+            cache[key] = efficiency
+        return efficiency
+
+    def _compute_efficiency(self, output_v: float, output_power: float, input_v: float) -> float:
         eff_power = None
-        if self.curves["efficiency_vs_output_power"]:
-            eff_power = eval_curve(self.curves["efficiency_vs_output_power"], output_power)
+        if self._has_power_curve:
+            eff_power = eval_curve(self._power_curve, output_power)
 
-        curve_key = "efficiency_vs_vout_277" if input_v >= 200 else "efficiency_vs_vout_120"
         eff_vout = None
-        if self.curves[curve_key]:
-            eff_vout = eval_curve(self.curves[curve_key], output_v)
+        if input_v >= 200:
+            if self._has_vout_277:
+                eff_vout = eval_curve(self._vout_277_curve, output_v)
+        elif self._has_vout_120:
+            eff_vout = eval_curve(self._vout_120_curve, output_v)
 
         eff_load = None
-        if self.curves["efficiency_vs_load"] and self.max_power > 0:
-            load_pct = clamp((output_power / self.max_power) * 100.0, 0.0, 150.0)
-            eff_load = eval_curve(self.curves["efficiency_vs_load"], load_pct)
+        if self._has_load_curve:
+            load_pct = clamp(output_power * self._inv_max_power * 100.0, 0.0, 150.0)
+            eff_load = eval_curve(self._load_curve, load_pct)
 
-        candidates = [c for c in (eff_power, eff_vout, eff_load) if c is not None]
-        if not candidates:
+        blended = self._blend(eff_power, eff_vout, eff_load)
+        if blended is None:
             return 0.85
-
-        primary = eff_power or eff_vout or eff_load
-        others = [c for c in candidates if c is not primary]
-        if not others or self.efficiency_blend_weight <= 0:
-            blended = sum(candidates) / len(candidates)
-        else:
-            others_avg = sum(others) / len(others)
-            blended = (primary * self.efficiency_blend_weight + others_avg) / (self.efficiency_blend_weight + 1.0)
         return clamp(blended, 0.5, 0.98)
 
-    def check_limits(self, input_v: float, required_v: float, output_power: float) -> List[str]:
-        issues: List[str] = []
-        if self.min_input_v and input_v < self.min_input_v:
-            issues.append(f"Input voltage {input_v:.1f} V is below driver min {self.min_input_v:.1f} V")
-        if self.max_input_v and input_v > self.max_input_v:
-            issues.append(f"Input voltage {input_v:.1f} V is above driver max {self.max_input_v:.1f} V")
-        if self.min_v and required_v < self.min_v:
-            issues.append(f"Load voltage {required_v:.2f} V is below driver regulation range ({self.min_v:.2f} V min)")
-        if self.max_v and required_v > self.max_v:
-            issues.append(f"Load voltage {required_v:.2f} V exceeds driver max {self.max_v:.2f} V")
-        if self.max_power and output_power > self.max_power:
-            issues.append(f"Output power {output_power:.2f} W exceeds driver limit {self.max_power:.2f} W")
-        return issues
-
-
-@dataclass
+    def estimate_efficiency_array(self, output_v: Any, output_power: Any, input_v: float) -> Any:
+        # Vectorized estimate_efficiency over arrays of operating points sharing one input voltage.
+        if not self._has_any_curve:
+            return np.full(np.shape(output_power), 0.85)
+        eff_power = eval_curve_array(self._power_curve, output_power) if self._has_power_curve else None
+
+        eff_vout = None
+        if input_v >= 200:
+            if self._has_vout_277:
+                eff_vout = eval_curve_array(self._vout_277_curve, output_v)
+        elif self._has_vout_120:
+            eff_vout = eval_curve_array(self._vout_120_curve, output_v)
+
+        eff_load = None
+        if self._has_load_curve:
+            load_pct = np.clip(output_power * (self._inv_max_power * 100.0), 0.0, 150.0)
+            eff_load = eval_curve_array(self._load_curve, load_pct)
+
+        blended = self._blend(eff_power, eff_vout, eff_load)
+        if blended is None:
+            return np.full(np.shape(output_power), 0.85)
+        return np.clip(blended, 0.5, 0.98)
+
+    def _blend(self, eff_power: Any, eff_vout: Any, eff_load: Any) -> Any:
+        # Works on floats or arrays: the first available estimate is the primary, the rest are averaged.
+        primary = None
+        others_sum = 0.0
+        others_n = 0
+        for value in (eff_power, eff_vout, eff_load):
+            if value is None:
+                continue
+            if primary is None:
+                primary = value
+            else:
+                others_sum += value
+                others_n += 1
+        if primary is None:
+            return None
+
+        if not others_n or self.efficiency_blend_weight <= 0:
+            return (primary + others_sum) / (others_n + 1)
+        return (primary * self.efficiency_blend_weight + others_sum / others_n) / self._blend_denom
+
+    def check_limits(self, input_v: float, required_v: float, output_power: float) -> Iterator[str]:
+        # Lazy: messages are only formatted for limits that are actually violated.
+        if self._has_min_input_limit and input_v < self.min_input_v:
+            yield f"Input voltage {input_v:.1f} V is below driver min {self.min_input_v:.1f} V"
+        if self._has_max_input_limit and input_v > self.max_input_v:
+            yield f"Input voltage {input_v:.1f} V is above driver max {self.max_input_v:.1f} V"
+        if self._has_min_v_limit and required_v < self.min_v:
+            yield f"Load voltage {required_v:.2f} V is below driver regulation range ({self.min_v:.2f} V min)"
+        if self._has_max_v_limit and required_v > self.max_v:
+            yield f"Load voltage {required_v:.2f} V exceeds driver max {self.max_v:.2f} V"
+        if self._has_max_power_limit and output_power > self.max_power:
+            yield f"Output power {output_power:.2f} W exceeds driver limit {self.max_power:.2f} W"
+
+    def has_limit_issue(self, input_v: float, required_v: float, output_power: float) -> bool:
+        return next(self.check_limits(input_v, required_v, output_power), None) is not None
+
+    def within_limits_array(self, input_v: float, required_v: Any, output_power: Any) -> Any:
+        # Vectorized check_limits: True where no driver limit is violated.
+        ok = np.ones(np.shape(required_v), dtype=bool)
+        if (self._has_min_input_limit and input_v < self.min_input_v) or (self._has_max_input_limit and input_v > self.max_input_v):
+            ok[...] = False
+        if self._has_min_v_limit:
+            ok &= required_v >= self.min_v
+        if self._has_max_v_limit:
+            ok &= required_v <= self.max_v
+        if self._has_max_power_limit:
+            ok &= output_power <= self.max_power
+        return ok
+
+
+@dataclass(frozen=True, slots=True)
 class Module:
     label: str
     series_count: int
@@ -169,26 +446,32 @@ class Module:
     nominal_current: Optional[float]
     nominal_current_per_led: Optional[float]
     iv_curve_led: Curve
+    # Memoized forward voltages keyed on module current; None when there is no IV curve.
+    _voltage_cache: Optional[Dict[float, float]] = _derived()
+
+    def __post_init__(self) -> None:
+        if self.iv_curve_led:
+            object.__setattr__(self, "_voltage_cache", {})
 
     @classmethod
     def from_file(cls, path: Path) -> "Module":
-        data = json.loads(path.read_text())
+        return cls.from_json(_json_loads(path.read_bytes()), path.stem)
+
+    @classmethod
+    def from_json(cls, data: dict, fallback_label: str) -> "Module":
         info = data.get("info", {})
         curves = data.get("curves", {})
-        typical_voltage_val = info.get("typical_voltage") or info.get("typical_voltage_v") or info.get("typ_voltage")
-        typical_voltage_total = info.get("typical_voltage_total") or info.get("module_voltage") or info.get("v_module")
-        typical_voltage_per_led = info.get("typical_voltage_per_led") or info.get("v_f") or info.get("vf")
         return cls(
-            label=str(info.get("model") or info.get("name") or info.get("led_model") or path.stem),
-            series_count=int(info.get("series_count") or 1),
-            parallel_count=int(info.get("parallel_count") or 1),
-            typical_voltage=float(typical_voltage_val) if typical_voltage_val is not None else None,
-            typical_voltage_per_led=float(typical_voltage_per_led) if typical_voltage_per_led is not None else None,
-            typical_voltage_total=float(typical_voltage_total) if typical_voltage_total is not None else None,
-            max_current=float(info.get("max_current")) if info.get("max_current") is not None else None,
-            max_current_per_led=float(info.get("max_current_per_led")) if info.get("max_current_per_led") is not None else None,
-            nominal_current=float(info.get("nominal_current")) if info.get("nominal_current") is not None else None,
-            nominal_current_per_led=float(info.get("nominal_current_per_led")) if info.get("nominal_current_per_led") is not None else None,
+            label=str(next((v for k in ("model", "name", "led_model") if (v := info.get(k))), fallback_label)),
+            series_count=int(_first(info, "series_count", default=1)),
+            parallel_count=int(_first(info, "parallel_count", default=1)),
+            typical_voltage=_optional_float(_first(info, "typical_voltage", "typical_voltage_v", "typ_voltage")),
+            typical_voltage_per_led=_optional_float(_first(info, "typical_voltage_per_led", "v_f", "vf")),
+            typical_voltage_total=_optional_float(_first(info, "typical_voltage_total", "module_voltage", "v_module")),
+            max_current=_optional_float(info.get("max_current")),
+            max_current_per_led=_optional_float(info.get("max_current_per_led")),
+            nominal_current=_optional_float(info.get("nominal_current")),
+            nominal_current_per_led=_optional_float(info.get("nominal_current_per_led")),
             iv_curve_led=build_curve(curves.get("iv_curve_led"), "current_amps", "volts_per_led"),
         )
 
@@ -210,6 +493,18 @@ class Module:
         return 0.5
 
     def forward_voltage(self, module_current_a: float) -> float:
+        cache = self._voltage_cache
+        if cache is None:
+            return self._compute_forward_voltage(module_current_a)
+        voltage = cache.get(module_current_a)
+        if voltage is None:
+            voltage = self._compute_forward_voltage(module_current_a)
+            if len(cache) >= MEMO_MAXSIZE:
+                cache.clear()
+            cache[module_current_a] = voltage
+        return voltage
+
+    def _compute_forward_voltage(self, module_current_a: float) -> float:
         per_string_current = module_current_a / max(1, self.parallel_count)
         per_led_v = eval_curve(self.iv_curve_led, per_string_current)
         if per_led_v is None and self.typical_voltage_per_led is not None:
@@ -224,11 +519,81 @@ class Module:
             raise ValueError(f"No IV data available to estimate voltage for {self.label}. Get Kailani!")
         return per_led_v * max(1, self.series_count)
 
+    def forward_voltage_array(self, module_currents_a: Any) -> Any:
+        # Vectorized forward_voltage over an array of module currents.
+        if not self.iv_curve_led:
+            # The typical-voltage fallbacks do not depend on current (and raise the same error when missing).
+            return np.full(np.shape(module_currents_a), self._compute_forward_voltage(0.0))
+        per_string_currents = module_currents_a / max(1, self.parallel_count)
+        return eval_curve_array(self.iv_curve_led, per_string_currents) * max(1, self.series_count)
+
+
+PROFILE_CACHE_SIZE = 32
+
+# Parsed profiles keyed on (type, file stem, content hash), so identical copies of a JSON
+# in different folders are parsed once. The stem is part of the key because it is the
+# fallback label.
+_parsed_by_content: Dict[tuple, Any] = {}
+
+
+def _load_profile(cls: Any, path: Path) -> Any:
+    data_bytes = path.read_bytes()
+    key = (cls.__name__, path.stem, hashlib.blake2b(data_bytes, digest_size=16).digest())
+    profile = _parsed_by_content.get(key)
+    if profile is None:
+        profile = cls.from_json(_json_loads(data_bytes), path.stem)
+        if len(_parsed_by_content) >= PROFILE_CACHE_SIZE:
+            _parsed_by_content.clear()
+        _parsed_by_content[key] = profile
+    return profile
+
+
+# Keyed on path + mtime so an edited JSON is picked up on the next run without re-reading unchanged files.
+@functools.lru_cache(maxsize=PROFILE_CACHE_SIZE)
+def _load_driver_cached(path_str: str, mtime_ns: int) -> Driver:
+    return _load_profile(Driver, Path(path_str))
+
+
+@functools.lru_cache(maxsize=PROFILE_CACHE_SIZE)
+def _load_module_cached(path_str: str, mtime_ns: int) -> Module:
+    return _load_profile(Module, Path(path_str))
+
+
+def load_driver(path: Path) -> Driver:
+    return _load_driver_cached(str(path), path.stat().st_mtime_ns)
+
+
+def load_module(path: Path) -> Module:
+    return _load_module_cached(str(path), path.stat().st_mtime_ns)
+
+
+def _load_many(loader: Any, paths: List[Path]) -> list:
+    # File reads and hashing overlap across threads; the caches dedupe repeated or identical files.
+    if not paths:
+        return []
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+        return list(pool.map(loader, paths))
+
+
+def load_drivers(paths: List[Path]) -> List[Driver]:
+    return _load_many(load_driver, paths)
+
+
+def load_modules(paths: List[Path]) -> List[Module]:
+    return _load_many(load_module, paths)
+
+
+def prepare(driver_path: Path, module_path: Path) -> Tuple[Driver, Module]:
+    return load_driver(driver_path), load_module(module_path)
+
 
 def simulate(driver_path: Path, module_path: Path, drive_current: Optional[float], input_voltage: float, override_module_voltage: Optional[float] = None) -> dict:
-    driver = Driver.from_file(driver_path)
-    module = Module.from_file(module_path)
+    driver, module = prepare(driver_path, module_path)
+    return operate(driver, module, drive_current, input_voltage, override_module_voltage)
 
+
+def operate(driver: Driver, module: Module, drive_current: Optional[float], input_voltage: float, override_module_voltage: Optional[float] = None) -> dict:
+    # Pure operating-point math on already-loaded profiles; never touches disk.
     current_a = drive_current if drive_current is not None else module.suggest_current()
     if current_a <= 0:
         raise ValueError("Drive current must be positive.")
@@ -271,6 +636,99 @@ def simulate(driver_path: Path, module_path: Path, drive_current: Optional[float
     }
 
 
+@functools.cache
+def _numba_sweep_kernel() -> Optional[Any]:
+    # Numba is imported and the kernel compiled (or loaded from its cache) on the first sweep only,
+    # keeping it off the CLI/GUI startup path. None (Numba missing or unusable) means simulate_sweep
+    # uses the NumPy path.
+    try:
+        from _sweep_numba import sweep_kernel
+
+        # Numba compiles on the first call, so make it here where a failure can still fall back.
+        point = np.zeros(1)
+        empty = np.empty(0)
+        sweep_kernel(np.ones(1), point, point, empty, empty, empty, empty, empty, empty, 1.0, 1.0, 0.0, 0.0, 1.0)
+    except Exception:
+        return None
+    return sweep_kernel
+
+
+def _sweep_fused(kernel: Any, driver: Driver, module: Module, currents: Any, input_v: float) -> tuple:
+    # Unpacks the profiles into plain arrays for the Numba kernel; missing curves become empty arrays.
+    empty = np.empty(0)
+
+    def arrays(curve: Curve, usable: bool) -> tuple:
+        return (curve.xs_arr, curve.ys_arr) if usable else (empty, empty)
+
+    if input_v >= 200:
+        vout = arrays(driver._vout_277_curve, driver._has_vout_277)
+    else:
+        vout = arrays(driver._vout_120_curve, driver._has_vout_120)
+    return kernel(
+        currents,
+        module.iv_curve_led.xs_arr,
+        module.iv_curve_led.ys_arr,
+        *arrays(driver._power_curve, driver._has_power_curve),
+        *vout,
+        *arrays(driver._load_curve, driver._has_load_curve),
+        float(max(1, module.series_count)),
+        float(max(1, module.parallel_count)),
+        driver._inv_max_power,
+        driver.efficiency_blend_weight,
+        driver._blend_denom,
+    )
+
+
+def simulate_sweep(driver_path: Path, module_path: Path, drive_currents: Any, input_voltage: float) -> dict:
+    # Batch version of simulate for current sweeps: every per-point quantity is a NumPy array.
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("NumPy is not installed. Install it to run current sweeps (pip install numpy).")
+    driver, module = prepare(driver_path, module_path)
+
+    currents = np.asarray(drive_currents, dtype=np.float64)
+    if currents.ndim != 1:
+        raise ValueError("Drive currents must be a 1-D array.")
+    if not np.all(np.isfinite(currents) & (currents > 0)):
+        raise ValueError("Drive currents must be positive, finite values.")
+
+    issues: List[str] = []
+    kernel = _numba_sweep_kernel() if module.iv_curve_led else None
+    if kernel is not None:
+        module_v, output_power, efficiency = _sweep_fused(kernel, driver, module, currents, input_voltage)
+    else:
+        try:
+            module_v = module.forward_voltage_array(currents)
+        except ValueError as exc:
+            issues.append(str(exc))
+            module_v = np.zeros_like(currents)
+        output_power = module_v * currents
+        efficiency = np.where(module_v > 0, driver.estimate_efficiency_array(module_v, output_power, input_voltage), 0.0)
+    input_power = np.divide(output_power, efficiency, out=np.zeros_like(output_power), where=efficiency > 0)
+
+    within_limits = driver.within_limits_array(input_voltage, module_v, output_power)
+    module_limit = module.max_module_current()
+    if module_limit is not None:
+        within_limits &= currents <= module_limit
+    if module.max_current_per_led is not None:
+        within_limits &= currents / max(1, module.parallel_count) <= module.max_current_per_led
+    if issues:
+        within_limits[...] = False
+
+    return {
+        "driver": driver.label,
+        "module": module.label,
+        "input_voltage": input_voltage,
+        "module_current": currents,
+        "module_voltage": module_v,
+        "driver_output_voltage": module_v,
+        "output_power": output_power,
+        "efficiency": efficiency,
+        "input_power": input_power,
+        "within_limits": within_limits,
+        "issues": issues,
+    }
+
+
 def print_result(result: dict) -> None:
     print(f"Driver: {result['driver']}")
     print(f"Module: {result['module']}")
@@ -330,10 +788,24 @@ def _ensure_desktop_shortcut(exe_path: Path) -> None:
 
 
 if QT_AVAILABLE:
+    @functools.cache
+    def _load_logo() -> Optional[QPixmap]:
+        # Decoded and scaled once; needs a QApplication, so it is only called from window setup.
+        logo_path = _find_logo_path()
+        if not logo_path:
+            return None
+        pix = QPixmap(logo_path)
+        if pix.isNull():
+            return None
+        return pix.scaledToHeight(72, Qt.TransformationMode.SmoothTransformation)
+
     class SimulationWindow(QMainWindow):
         def __init__(self) -> None:
             super().__init__()
             self.setWindowTitle("ProDriver: Bite Edition")
+            # Profiles loaded for the current paths; cleared whenever a path changes.
+            self._driver: Optional[Driver] = None
+            self._module: Optional[Module] = None
             self._build_ui()
             self._apply_theme()
 
@@ -354,13 +826,11 @@ if QT_AVAILABLE:
             self.product_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
             top_row.addWidget(self.product_label, 0)
 
-            logo_path = _find_logo_path()
             self.logo_label = QLabel()
             self.logo_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            if logo_path:
-                pix = QPixmap(logo_path)
-                if not pix.isNull():
-                    self.logo_label.setPixmap(pix.scaledToHeight(72, Qt.TransformationMode.SmoothTransformation))
+            logo = _load_logo()
+            if logo is not None:
+                self.logo_label.setPixmap(logo)
             top_row.addStretch(1)
             top_row.addWidget(self.logo_label, 0)
             header.addLayout(top_row)
@@ -374,6 +844,7 @@ if QT_AVAILABLE:
             form = QFormLayout()
             self.driver_path = QLineEdit(_default_path("BST1.json") or _default_path("BST2.json") or "")
             self.driver_path.setMinimumWidth(360)
+            self.driver_path.textChanged.connect(self._invalidate_profiles)
             btn_browse_driver = QPushButton("Browse")
             btn_browse_driver.clicked.connect(self._choose_driver)
             driver_row = QHBoxLayout()
@@ -383,6 +854,7 @@ if QT_AVAILABLE:
 
             self.module_path = QLineEdit(_default_path("HO7_4800lm.json") or _default_path("HO5.json") or "")
             self.module_path.setMinimumWidth(360)
+            self.module_path.textChanged.connect(self._invalidate_profiles)
             btn_browse_module = QPushButton("Browse")
             btn_browse_module.clicked.connect(self._choose_module)
             module_row = QHBoxLayout()
@@ -462,11 +934,18 @@ if QT_AVAILABLE:
             path, _ = QFileDialog.getOpenFileName(self, "Select driver JSON", ".", "JSON Files (*.json)")
             if path:
                 self.driver_path.setText(path)
+                # Re-selecting the same file emits no textChanged; reload it anyway.
+                self._invalidate_profiles()
 
         def _choose_module(self) -> None:
             path, _ = QFileDialog.getOpenFileName(self, "Select module JSON", ".", "JSON Files (*.json)")
             if path:
                 self.module_path.setText(path)
+                self._invalidate_profiles()
+
+        def _invalidate_profiles(self) -> None:
+            self._driver = None
+            self._module = None
 
         def _run_calc(self) -> None:
             driver_file = self.driver_path.text().strip()
@@ -477,7 +956,9 @@ if QT_AVAILABLE:
             drive_current_ma = float(self.current_spin.value())
             drive_current = drive_current_ma / 1000.0
             try:
-                result = simulate(Path(driver_file), Path(module_file), drive_current, float(self.input_v.value()))
+                if self._driver is None or self._module is None:
+                    self._driver, self._module = prepare(Path(driver_file), Path(module_file))
+                result = operate(self._driver, self._module, drive_current, float(self.input_v.value()))
             except Exception as exc:
                 QMessageBox.warning(self, "Simulation failed", str(exc))
                 return
@@ -496,7 +977,7 @@ if QT_AVAILABLE:
                 )
                 if ok and val > 0:
                     try:
-                        result = simulate(Path(driver_file), Path(module_file), drive_current, float(self.input_v.value()), override_module_voltage=val)
+                        result = operate(self._driver, self._module, drive_current, float(self.input_v.value()), override_module_voltage=val)
                     except Exception as exc:
                         QMessageBox.warning(self, "Simulation failed", str(exc))
                         return
@@ -520,82 +1001,11 @@ if QT_AVAILABLE:
                 self.issues_box.setPlainText("No issues. All limits OK.")
 
         def _apply_theme(self) -> None:
-            theme = f"""
-                QMainWindow {{
-                    background-color: {COLOR_BG};
-                    color: {COLOR_TEXT};
-                    font-family: "Century Gothic", "Arial", sans-serif;
-                }}
-                QWidget {{
-                    background-color: {COLOR_BG};
-                    color: {COLOR_TEXT};
-                    font-family: "Century Gothic", "Arial", sans-serif;
-                }}
-                QLabel {{
-                    color: {COLOR_TEXT};
-                    font-size: 12pt;
-                    font-family: "Century Gothic", "Arial", sans-serif;
-                }}
-                QLineEdit, QTextEdit {{
-                    background-color: #f5f5f5;
-                    color: {COLOR_TEXT};
-                    border: 1px solid #d1d5db;
-                    padding: 4px;
-                    font-family: "Century Gothic", "Arial", sans-serif;
-                }}
-                QDoubleSpinBox {{
-                    background-color: #f5f5f5;
-                    color: {COLOR_TEXT};
-                    border: 1px solid #d1d5db;
-                    padding: 2px 4px;
-                    min-height: 28px;
-                    font-family: "Century Gothic", "Arial", sans-serif;
-                }}
-                QDoubleSpinBox::up-button, QDoubleSpinBox::down-button {{
-                    background: #e5e7eb;
-                    width: 18px;
-                    border: 1px solid #d1d5db;
-                }}
-                QDoubleSpinBox::up-arrow, QDoubleSpinBox::down-arrow {{
-                    width: 10px;
-                    height: 10px;
-                }}
-                QDoubleSpinBox::up-arrow {{
-                    image: url("data:image/svg+xml;utf8,<svg xmlns='http://www.w3.org/2000/svg' width='10' height='10'><path d='M1 7 L5 1 L9 7 Z' fill='%230b0b0b'/></svg>");
-                }}
-                QDoubleSpinBox::down-arrow {{
-                    image: url("data:image/svg+xml;utf8,<svg xmlns='http://www.w3.org/2000/svg' width='10' height='10'><path d='M1 3 L5 9 L9 3 Z' fill='%230b0b0b'/></svg>");
-                }}
-                QCheckBox {{
-                    color: {COLOR_TEXT};
-                }}
-                QPushButton {{
-                    background-color: {COLOR_ACCENT};
-                    color: #0b0b0b;
-                    border: 1px solid {COLOR_ACCENT};
-                    padding: 6px 12px;
-                    font-weight: bold;
-                    border-radius: 4px;
-                }}
-                QPushButton:hover {{
-                    background-color: #8ed452;
-                    border-color: #8ed452;
-                }}
-                QPlainTextEdit, QTextEdit {{
-                    background-color: #f9fafb;
-                    color: {COLOR_TEXT};
-                    border: 1px solid #d1d5db;
-                }}
-                QToolTip {{
-                    background-color: #e5e7eb;
-                    color: {COLOR_TEXT};
-                    border: 1px solid {COLOR_ACCENT};
-                }}
-            """
-            self.setStyleSheet(theme)
+            self.setStyleSheet(_THEME_QSS)
 
     def launch_ui() -> None:
         app = QApplication(sys.argv)
+        # Also names the per-user cache directory used for rendered theme assets.
         try:
             app.setStyle(QStyleFactory.create("Fusion"))
         except Exception:
@@ -0,0 +1,9 @@
+# Optional compiled curve kernel; main.py falls back to NumPy when it is not built.
+# Build in place with: python setup.py build_ext --inplace
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+setup(
+    name="prodriver-curve-ext",
+    ext_modules=cythonize([Extension("_curve", ["_curve.pyx"])], compiler_directives={"language_level": "3"}),
+)